@@ -1,4 +1,5 @@
-from typing import Sequence
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Sequence
 from edenai_apis.features.text.anonymization.anonymization_dataclass import (
     AnonymizationDataClass,
 )
@@ -26,7 +27,146 @@ from botocore.exceptions import ClientError
 from .config import tags
 
 
+# Comprehend accepts at most 25 documents per BatchDetect* call
+BATCH_MAX_DOCUMENTS = 25
+
+
+def _standardize_sentiment(response: Dict) -> SentimentAnalysisDataClass:
+    scores = response["SentimentScore"]
+    # scanned in reverse so that, on ties, the last sentiment wins as it always did
+    key, rate = max(
+        (
+            (sentiment, score)
+            for sentiment, score in reversed(scores.items())
+            if sentiment != "Mixed"
+        ),
+        key=lambda item: item[1],
+    )
+
+    return SentimentAnalysisDataClass(
+        general_sentiment=key, general_sentiment_rate=rate, items=[]
+    )
+
+
+def _standardize_keyword_extraction(response: Dict) -> KeywordExtractionDataClass:
+    items: Sequence[InfosKeywordExtractionDataClass] = [
+        InfosKeywordExtractionDataClass(
+            keyword=key_phrase["Text"], importance=key_phrase["Score"]
+        )
+        for key_phrase in response["KeyPhrases"]
+    ]
+
+    return KeywordExtractionDataClass(items=items)
+
+
+def _standardize_named_entity_recognition(
+    response: Dict,
+) -> NamedEntityRecognitionDataClass:
+    items: Sequence[InfosNamedEntityRecognitionDataClass] = [
+        InfosNamedEntityRecognitionDataClass(
+            entity=ent["Text"],
+            importance=ent["Score"],
+            category=ent["Type"],
+        )
+        for ent in response["Entities"]
+    ]
+
+    return NamedEntityRecognitionDataClass(items=items)
+
+
+def _standardize_syntax_analysis(response: Dict) -> SyntaxAnalysisDataClass:
+    tags_local = tags
+    syntax_cls = InfosSyntaxAnalysisDataClass
+
+    # Getting syntax detected of word and its score of confidence
+    items: Sequence[InfosSyntaxAnalysisDataClass] = [
+        syntax_cls(
+            word=ent["Text"],
+            importance=(part_of_speech := ent["PartOfSpeech"])["Score"],
+            tag=tags_local[part_of_speech["Tag"]],
+        )
+        for ent in response["SyntaxTokens"]
+    ]
+
+    return SyntaxAnalysisDataClass(items=items)
+
+
+def _standardize_batch(outcomes: List[Dict], standardize: Callable) -> List:
+    # documents comprehend failed on are kept as None to preserve input indexes
+    return [
+        None if "ErrorCode" in outcome else standardize(outcome) for outcome in outcomes
+    ]
+
+
 class AmazonTextApi(TextInterface):
+    def _batch_detect(
+        self, operation: str, language: str, texts: List[str]
+    ) -> List[Dict]:
+        """Calls a comprehend BatchDetect* operation on `texts`, by chunks of
+        BATCH_MAX_DOCUMENTS, and returns results ordered as the input texts.
+
+        Documents comprehend failed on are returned as their ErrorList entry
+        (ErrorCode, ErrorMessage); only call-level errors are raised."""
+        outcomes: List[Dict] = []
+        iterator = iter(texts)
+        offset = 0
+        while chunk := list(islice(iterator, BATCH_MAX_DOCUMENTS)):
+            try:
+                response = getattr(self.clients["text"], operation)(
+                    TextList=chunk, LanguageCode=language
+                )
+            except ClientError as exc:
+                if "languageCode" in str(exc):
+                    raise LanguageException(str(exc)) from exc
+                raise ProviderException(str(exc)) from exc
+
+            for outcome in response["ResultList"] + response["ErrorList"]:
+                outcomes.append({**outcome, "Index": offset + outcome["Index"]})
+            offset += len(chunk)
+        return sorted(outcomes, key=lambda outcome: outcome["Index"])
+
+    def _text__sentiment_analysis__batch(
+        self, language: str, texts: List[str]
+    ) -> ResponseType[List[Optional[SentimentAnalysisDataClass]]]:
+        response = self._batch_detect("batch_detect_sentiment", language, texts)
+        return ResponseType[List[Optional[SentimentAnalysisDataClass]]](
+            original_response=response,
+            standardized_response=_standardize_batch(response, _standardize_sentiment),
+        )
+
+    def _text__keyword_extraction__batch(
+        self, language: str, texts: List[str]
+    ) -> ResponseType[List[Optional[KeywordExtractionDataClass]]]:
+        response = self._batch_detect("batch_detect_key_phrases", language, texts)
+        return ResponseType[List[Optional[KeywordExtractionDataClass]]](
+            original_response=response,
+            standardized_response=_standardize_batch(
+                response, _standardize_keyword_extraction
+            ),
+        )
+
+    def _text__named_entity_recognition__batch(
+        self, language: str, texts: List[str]
+    ) -> ResponseType[List[Optional[NamedEntityRecognitionDataClass]]]:
+        response = self._batch_detect("batch_detect_entities", language, texts)
+        return ResponseType[List[Optional[NamedEntityRecognitionDataClass]]](
+            original_response=response,
+            standardized_response=_standardize_batch(
+                response, _standardize_named_entity_recognition
+            ),
+        )
+
+    def _text__syntax_analysis__batch(
+        self, language: str, texts: List[str]
+    ) -> ResponseType[List[Optional[SyntaxAnalysisDataClass]]]:
+        response = self._batch_detect("batch_detect_syntax", language, texts)
+        return ResponseType[List[Optional[SyntaxAnalysisDataClass]]](
+            original_response=response,
+            standardized_response=_standardize_batch(
+                response, _standardize_syntax_analysis
+            ),
+        )
+
     def text__sentiment_analysis(
         self, language: str, text: str
     ) -> ResponseType[SentimentAnalysisDataClass]:
@@ -40,31 +180,7 @@ class AmazonTextApi(TextInterface):
                 raise LanguageException(str(exc))
 
         # Analysing response
-
-        best_sentiment = {
-            "general_sentiment": None,
-            "general_sentiment_rate": 0,
-            "items": [],
-        }
-
-        for key in response["SentimentScore"]:
-            if key == "Mixed":
-                continue
-
-            if (
-                best_sentiment["general_sentiment_rate"]
-                <= response["SentimentScore"][key]
-            ):
-                best_sentiment["general_sentiment"] = key
-                best_sentiment["general_sentiment_rate"] = response["SentimentScore"][
-                    key
-                ]
-
-        standarize = SentimentAnalysisDataClass(
-            general_sentiment=best_sentiment["general_sentiment"],
-            general_sentiment_rate=best_sentiment["general_sentiment_rate"],
-            items=[],
-        )
+        standarize = _standardize_sentiment(response)
 
         return ResponseType[SentimentAnalysisDataClass](
             original_response=response, standardized_response=standarize
@@ -83,15 +199,7 @@ class AmazonTextApi(TextInterface):
                 raise LanguageException(str(exc))
 
         # Analysing response
-        items: Sequence[InfosKeywordExtractionDataClass] = []
-        for key_phrase in response["KeyPhrases"]:
-            items.append(
-                InfosKeywordExtractionDataClass(
-                    keyword=key_phrase["Text"], importance=key_phrase["Score"]
-                )
-            )
-
-        standardized_response = KeywordExtractionDataClass(items=items)
+        standardized_response = _standardize_keyword_extraction(response)
 
         return ResponseType[KeywordExtractionDataClass](
             original_response=response, standardized_response=standardized_response
@@ -111,18 +219,7 @@ class AmazonTextApi(TextInterface):
             else:
                 raise ProviderException(str(exc)) from exc
 
-        items: Sequence[InfosNamedEntityRecognitionDataClass] = []
-        for ent in response["Entities"]:
-
-            items.append(
-                InfosNamedEntityRecognitionDataClass(
-                    entity=ent["Text"],
-                    importance=ent["Score"],
-                    category=ent["Type"],
-                )
-            )
-
-        standardized = NamedEntityRecognitionDataClass(items=items)
+        standardized = _standardize_named_entity_recognition(response)
 
         return ResponseType[NamedEntityRecognitionDataClass](
             original_response=response, standardized_response=standardized
@@ -141,24 +238,8 @@ class AmazonTextApi(TextInterface):
             if "languageCode" in str(exc):
                 raise LanguageException(str(exc))
 
-        # Create output TextSyntaxAnalysis object
-
-        items: Sequence[InfosSyntaxAnalysisDataClass] = []
-
         # Analysing response
-        #
-        # Getting syntax detected of word and its score of confidence
-        for ent in response["SyntaxTokens"]:
-            tag = tags[ent["PartOfSpeech"]["Tag"]]
-            items.append(
-                InfosSyntaxAnalysisDataClass(
-                    word=ent["Text"],
-                    importance=ent["PartOfSpeech"]["Score"],
-                    tag=tag,
-                )
-            )
-
-        standardized_response = SyntaxAnalysisDataClass(items=items)
+        standardized_response = _standardize_syntax_analysis(response)
 
         return ResponseType[SyntaxAnalysisDataClass](
             original_response=response, standardized_response=standardized_response
@@ -175,10 +256,14 @@ class AmazonTextApi(TextInterface):
             raise ProviderException(exc) from exc
 
         last_end = 0
-        new_text = ""
+        parts = []
+        append = parts.append
         for entity in res["Entities"]:
-            new_text += text[last_end : entity["BeginOffset"]] + f"<{entity['Type']}>"
+            append(text[last_end : entity["BeginOffset"]])
+            append(f"<{entity['Type']}>")
             last_end = entity["EndOffset"]
+        append(text[last_end:])
+        new_text = "".join(parts)
         standardized_response = AnonymizationDataClass(result=new_text)
         return ResponseType(
             original_response=res, standardized_response=standardized_response
@@ -1,6 +1,32 @@
-import boto3
+from functools import lru_cache
 from typing import Dict
 
+import boto3
+from botocore.config import Config
+
+_COMPREHEND_CFG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    connect_timeout=5,
+    read_timeout=30,
+)
+
+
+@lru_cache(maxsize=None)
+def _comprehend_client(
+    region_name: str, aws_access_key_id: str, aws_secret_access_key: str
+):
+    """Comprehend client built once per credentials with _COMPREHEND_CFG"""
+    return boto3.client(
+        "comprehend",
+        region_name=region_name,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        config=_COMPREHEND_CFG,
+    )
+
+
 def clients(api_settings : Dict) -> Dict:
     return {
         "speech": boto3.client(
@@ -27,8 +53,7 @@ def clients(api_settings : Dict) -> Dict:
             aws_access_key_id=api_settings["aws_access_key_id"],
             aws_secret_access_key=api_settings["aws_secret_access_key"],
         ),
-        "text": boto3.client(
-            "comprehend",
+        "text": _comprehend_client(
             region_name=api_settings["region_name"],
             aws_access_key_id=api_settings["aws_access_key_id"],
             aws_secret_access_key=api_settings["aws_secret_access_key"],
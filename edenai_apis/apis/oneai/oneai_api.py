@@ -1,9 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from io import BufferedReader
 import json
-from typing import List, Optional
+from typing import Callable, List, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from edenai_apis.features import (
     ProviderInterface,
     TextInterface,
@@ -45,6 +50,32 @@ from edenai_apis.utils.types import (
 
 from edenai_apis.utils.languages import get_code_from_language_name
 
+_SPK_PREFIX_LEN = len("speaker")
+_ONEAI_CAT_MAP = {"GEO": "LOCATION"}
+
+
+@lru_cache(maxsize=None)
+def _oneai_session(api_key: str) -> requests.Session:
+    """OneaiApi is built on every call: keep one keep-alive session per api key"""
+    session = requests.Session()
+    session.headers.update({
+        "api-key": api_key,
+        "accept": "application/json",
+        "Content-Type": "application/json",
+    })
+    # POST is left out of the retried methods: a gateway error after OneAI accepted
+    # an async job would otherwise launch (and bill) it again.
+    # raise_on_status=False lets the last response reach our status checks
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
 class StatusEnum(Enum):
     SUCCESS = 'COMPLETED'
     RUNNING = 'RUNNING'
@@ -62,25 +93,57 @@ class OneaiApi(
         self.api_settings = load_provider(ProviderDataEnum.KEY, self.provider_name)
         self.api_key = self.api_settings['api_key']
         self.url = self.api_settings['url']
-        self.header = {
-            "api-key": self.api_key,
-            "accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        self._session = _oneai_session(self.api_key)
+
+    @staticmethod
+    def _parse(response: requests.Response) -> dict:
+        """Decodes a OneAI response body with orjson, much faster than
+        the stdlib json on large transcripts"""
+        return orjson.loads(response.content)
+
+    def _batch(
+        self,
+        method: Callable[..., ResponseType],
+        language: str,
+        texts: List[str],
+        max_workers: int = 16,
+    ) -> List[ResponseType]:
+        """Runs `method` on each text in threads, since OneAI has no batch endpoint"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda text: method(language=language, text=text), texts))
+
+    def _text__anonymization__batch(
+        self, language: str, texts: List[str]
+    ) -> List[ResponseType[AnonymizationDataClass]]:
+        return self._batch(self.text__anonymization, language, texts)
+
+    def _text__keyword_extraction__batch(
+        self, language: str, texts: List[str]
+    ) -> List[ResponseType[KeywordExtractionDataClass]]:
+        return self._batch(self.text__keyword_extraction, language, texts)
+
+    def _text__named_entity_recognition__batch(
+        self, language: str, texts: List[str]
+    ) -> List[ResponseType[NamedEntityRecognitionDataClass]]:
+        return self._batch(self.text__named_entity_recognition, language, texts)
+
+    def _text__sentiment_analysis__batch(
+        self, language: str, texts: List[str]
+    ) -> List[ResponseType[SentimentAnalysisDataClass]]:
+        return self._batch(self.text__sentiment_analysis, language, texts)
 
-    
     def text__anonymization(self, text: str, language: str) -> ResponseType[AnonymizationDataClass]:
-        data = json.dumps({
+        data = {
             "input": text,
             "steps": [
                 {
                     "skill": "anonymize"
                 }
             ]
-        })
+        }
 
-        response = requests.post(url=self.url, headers=self.header, data=data)
-        original_response = response.json()
+        response = self._session.post(url=self.url, json=data)
+        original_response = self._parse(response)
 
         if response.status_code != 200:
             raise ProviderException(message=original_response['message'], code=response.status_code)
@@ -94,24 +157,28 @@ class OneaiApi(
 
 
     def text__keyword_extraction(self, language: str, text: str) -> ResponseType[KeywordExtractionDataClass]:
-        data = json.dumps({
+        data = {
             "input": text,
             "steps": [
                 {
                     "skill": "keywords"
                 }
             ]
-        })
+        }
 
-        response = requests.post(url=self.url, headers=self.header, data=data)
-        original_response = response.json()
+        response = self._session.post(url=self.url, json=data)
+        original_response = self._parse(response)
 
         if response.status_code != 200:
             raise ProviderException(message=original_response['message'], code=response.status_code)
 
-        items = []
-        for item in original_response['output'][0]['labels']:
-            items.append(InfosKeywordExtractionDataClass(keyword=item['span_text'], importance=round(item['value'], 2)))
+        items = [
+            InfosKeywordExtractionDataClass(
+                keyword=item['span_text'],
+                importance=round(item['value'], 2)
+            )
+            for item in original_response['output'][0]['labels']
+        ]
 
         standardized_response = KeywordExtractionDataClass(items=items)
 
@@ -121,28 +188,28 @@ class OneaiApi(
         )
 
     def text__named_entity_recognition(self, language: str, text: str) -> ResponseType[NamedEntityRecognitionDataClass]:
-        data = json.dumps({
+        data = {
             "input": text,
             "steps": [
                 {
                     "skill": "names"
                 }
             ]
-        })
+        }
 
-        response = requests.post(url=self.url, headers=self.header, data=data)
-        original_response = response.json()
+        response = self._session.post(url=self.url, json=data)
+        original_response = self._parse(response)
 
         if response.status_code != 200:
             raise ProviderException(message=original_response['message'], code=response.status_code)
 
-        items = []
-        for item in original_response['output'][0]['labels']:
-            entity = item['value']
-            category = item['name']
-            if category == 'GEO':
-                category = 'LOCATION'
-            items.append(InfosNamedEntityRecognitionDataClass(entity=entity, category=category))
+        items = [
+            InfosNamedEntityRecognitionDataClass(
+                entity=item['value'],
+                category=_ONEAI_CAT_MAP.get(item['name'], item['name'])
+            )
+            for item in original_response['output'][0]['labels']
+        ]
 
         standardized_response = NamedEntityRecognitionDataClass(items=items)
 
@@ -152,17 +219,17 @@ class OneaiApi(
         )
 
     def text__sentiment_analysis(self, language: str, text: str) -> ResponseType[SentimentAnalysisDataClass]:
-        data = json.dumps({
+        data = {
             "input": text,
             "steps": [
                 {
                     "skill": "sentiments"
                 }
             ]
-        })
+        }
 
-        response = requests.post(url=self.url, headers=self.header, data=data)
-        original_response = response.json()
+        response = self._session.post(url=self.url, json=data)
+        original_response = self._parse(response)
 
         if response.status_code != 200:
             raise ProviderException(message=original_response['message'], code=response.status_code)
@@ -170,19 +237,18 @@ class OneaiApi(
         items = []
         general_sentiment = 0
         for item in original_response['output'][0]['labels']:
-            segment = item['span_text']
-            sentiment = SentimentEnum.NEGATIVE if item['value'] == 'NEG' else SentimentEnum.POSITIVE
-            general_sentiment += 1 if sentiment == SentimentEnum.POSITIVE else -1
+            delta = 1 if item['value'] == 'POS' else -1
+            general_sentiment += delta
             items.append(SegmentSentimentAnalysisDataClass(
-                segment=segment,
-                sentiment=sentiment.value
+                segment=item['span_text'],
+                sentiment=(SentimentEnum.POSITIVE if delta > 0 else SentimentEnum.NEGATIVE).value
             ))
 
-        general_sentiment_text = SentimentEnum.NEUTRAL
-        if general_sentiment < 0:
-            general_sentiment_text = SentimentEnum.NEGATIVE
-        elif general_sentiment > 0:
-            general_sentiment = SentimentEnum.POSITIVE
+        general_sentiment_text = (
+            SentimentEnum.POSITIVE if general_sentiment > 0
+            else SentimentEnum.NEGATIVE if general_sentiment < 0
+            else SentimentEnum.NEUTRAL
+        )
 
         standardized_response = SentimentAnalysisDataClass(
             general_sentiment=general_sentiment_text.value,
@@ -195,17 +261,17 @@ class OneaiApi(
         )
 
     def text__summarize(self, text: str, output_sentences: int, language: str, model: Optional[str]) -> ResponseType[SummarizeDataClass]:
-        data = json.dumps({
+        data = {
             "input": text,
             "steps": [
                 {
                     "skill": "summarize"
                 }
             ]
-        })
+        }
 
-        response = requests.post(url=self.url, headers=self.header, data=data)
-        original_response = response.json()
+        response = self._session.post(url=self.url, json=data)
+        original_response = self._parse(response)
 
         if response.status_code != 200:
             raise ProviderException(message=original_response['message'], code=response.status_code)
@@ -220,7 +286,7 @@ class OneaiApi(
         )
 
     def translation__language_detection(self, text) -> ResponseType[LanguageDetectionDataClass]:
-        data = json.dumps({
+        data = {
             "input": text,
             "steps": [
                 {
@@ -228,20 +294,21 @@ class OneaiApi(
                 }
             ],
             "multilingual": True
-        })
+        }
 
-        response = requests.post(url=self.url, headers=self.header, data=data)
-        original_response = response.json()
+        response = self._session.post(url=self.url, json=data)
+        original_response = self._parse(response)
 
         if response.status_code != 200:
             raise ProviderException(message=original_response['message'], code=response.status_code)
 
-        items = []
-        for item in original_response['output'][0]['labels']:
-            items.append(InfosLanguageDetectionDataClass(
+        items = [
+            InfosLanguageDetectionDataClass(
                 language=get_code_from_language_name(name=item['value']),
                 display_name=item['value']
-            ))
+            )
+            for item in original_response['output'][0]['labels']
+        ]
 
         return ResponseType[LanguageDetectionDataClass](
             original_response=original_response,
@@ -278,9 +345,11 @@ class OneaiApi(
             "multilingual": True
         }
 
-        file_ = open(file, "rb")
-        response = requests.post(url=f"{self.url}/async/file?pipeline={json.dumps(data)}", headers=self.header, data=file_.read())
-        original_response = response.json()
+        with open(file, "rb") as file_:
+            response = self._session.post(
+                url=f"{self.url}/async/file?pipeline={json.dumps(data)}", data=file_
+            )
+        original_response = self._parse(response)
 
         if response.status_code != 200:
             raise ProviderException(message=original_response['message'], code=response.status_code)
@@ -291,33 +360,31 @@ class OneaiApi(
 
 
     def audio__speech_to_text_async__get_job_result(self, provider_job_id: str) -> AsyncBaseResponseType[SpeechToTextAsyncDataClass]:
-        response = requests.get(url=f"{self.url}/async/tasks/{provider_job_id}", headers=self.header)
+        response = self._session.get(url=f"{self.url}/async/tasks/{provider_job_id}")
 
-        original_response = response.json()
+        original_response = self._parse(response)
 
         if response.status_code == 200:
             if original_response['status'] == StatusEnum.SUCCESS.value:
-                final_text = ""
-                phrase = original_response['result']['input_text'].split('\n\n')
-                for item in phrase:
-                    if item != '':
-                        *options, text = item.split('\n')
-                        final_text += f"{text} "
-                
-                diarization_entries = []
-                speakers = set()
-                words_info = original_response["result"]["output"][0]["labels"]
+                parts = []
+                for item in original_response['result']['input_text'].split('\n\n'):
+                    if item:
+                        parts.append(item.rpartition('\n')[2])
+                final_text = " ".join(parts)
 
-                for word_info in words_info:
-                    speakers.add(word_info["speaker"])
-                    diarization_entries.append(
-                        SpeechDiarizationEntry(
-                            segment= word_info["span_text"],
-                            start_time= word_info["timestamp"],
-                            end_time= word_info["timestamp_end"],
-                            speaker= int(word_info["speaker"].split("speaker")[1])
-                        )
+                words_info = original_response["result"]["output"][0]["labels"]
+                speakers = set(word_info["speaker"] for word_info in words_info)
+
+                entry_cls = SpeechDiarizationEntry
+                diarization_entries = [
+                    entry_cls(
+                        segment= word_info["span_text"],
+                        start_time= word_info["timestamp"],
+                        end_time= word_info["timestamp_end"],
+                        speaker= int(word_info["speaker"][_SPK_PREFIX_LEN:])
                     )
+                    for word_info in words_info
+                ]
                 diarization = SpeechDiarization(total_speakers=len(speakers), entries= diarization_entries)
                 standardized_response=SpeechToTextAsyncDataClass(text=final_text.strip(),
                         diarization= diarization)
@@ -0,0 +1,96 @@
+"""
+    AmazonTextApi sends batches to comprehend BatchDetect* operations by chunks of 25
+    documents; these tests check the chunking and how outcomes are mapped back to inputs.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from edenai_apis.apis.amazon.amazon_api import AmazonApi
+from edenai_apis.utils.exception import ProviderException
+
+
+def batch_detect_sentiment(TextList, LanguageCode):
+    """Fake comprehend batch_detect_sentiment returning its results in reverse order"""
+    results = [
+        {
+            "Index": index,
+            "Sentiment": "POSITIVE",
+            "SentimentScore": {"Positive": 0.9, "Negative": 0.05, "Neutral": 0.05, "Mixed": 0.0},
+            "Text": text,
+        }
+        for index, text in enumerate(TextList)
+    ]
+    return {"ResultList": results[::-1], "ErrorList": []}
+
+
+class TestBatchDetect:
+    def setup_method(self):
+        # skip AmazonApi.__init__, which loads api keys and builds every boto3 client
+        self.amazon_api = AmazonApi.__new__(AmazonApi)
+        self.amazon_api.clients = {"text": MagicMock()}
+
+    def test_texts_are_sent_by_chunks_of_25(self):
+        client = self.amazon_api.clients["text"]
+        client.batch_detect_sentiment.side_effect = batch_detect_sentiment
+        texts = [f"text {index}" for index in range(60)]
+
+        output = self.amazon_api._batch_detect("batch_detect_sentiment", "en", texts)
+
+        sent_chunks = [
+            call.kwargs["TextList"] for call in client.batch_detect_sentiment.call_args_list
+        ]
+        assert sent_chunks == [texts[:25], texts[25:50], texts[50:]], \
+            "Texts must be sent by chunks of 25 documents"
+        assert [result["Text"] for result in output] == texts, \
+            "Results must be ordered as the input texts"
+
+    def test_results_out_of_order_are_sorted(self):
+        self.amazon_api.clients["text"].batch_detect_sentiment.side_effect = batch_detect_sentiment
+        texts = ["first", "second", "third"]
+
+        output = self.amazon_api._text__sentiment_analysis__batch("en", texts)
+
+        assert [result["Text"] for result in output.original_response] == texts, \
+            "Results must be ordered as the input texts"
+        assert len(output.standardized_response) == len(texts)
+        assert all(
+            res.general_sentiment == "Positive" for res in output.standardized_response
+        )
+
+    def test_error_in_second_chunk_keeps_other_documents(self):
+        def batch_detect_with_error(TextList, LanguageCode):
+            response = batch_detect_sentiment(TextList, LanguageCode)
+            if TextList[0] == "text 25":
+                response["ResultList"] = [
+                    result for result in response["ResultList"] if result["Index"] != 3
+                ]
+                response["ErrorList"] = [
+                    {"Index": 3, "ErrorCode": "INVALID_REQUEST", "ErrorMessage": "too long"}
+                ]
+            return response
+
+        self.amazon_api.clients["text"].batch_detect_sentiment.side_effect = batch_detect_with_error
+        texts = [f"text {index}" for index in range(30)]
+
+        output = self.amazon_api._text__sentiment_analysis__batch("en", texts)
+
+        assert [outcome["Index"] for outcome in output.original_response] == list(range(30))
+        assert output.original_response[28]["ErrorCode"] == "INVALID_REQUEST", \
+            "The failed document must be reported at its index in the input texts"
+        assert output.standardized_response[28] is None
+        assert all(
+            res is not None
+            for index, res in enumerate(output.standardized_response)
+            if index != 28
+        ), "The other documents must still be returned"
+
+    def test_call_error_is_raised(self):
+        self.amazon_api.clients["text"].batch_detect_sentiment.side_effect = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+            "BatchDetectSentiment",
+        )
+
+        with pytest.raises(ProviderException):
+            self.amazon_api._batch_detect("batch_detect_sentiment", "en", ["text"])
@@ -0,0 +1,88 @@
+"""
+    OneaiApi tests run against a fake api key, with the HTTP session
+    or the single-document methods stubbed.
+"""
+import time
+from unittest.mock import MagicMock
+
+import orjson
+
+import pytest
+from pytest_mock import MockerFixture
+
+from edenai_apis.apis.oneai.oneai_api import OneaiApi
+from edenai_apis.utils.exception import ProviderException
+
+
+@pytest.fixture
+def oneai_api(mocker: MockerFixture) -> OneaiApi:
+    mocker.patch(
+        'edenai_apis.apis.oneai.oneai_api.load_provider',
+        return_value={'api_key': 'test_key', 'url': 'https://api.oneai.test'}
+    )
+    return OneaiApi()
+
+
+class TestBatch:
+    def test_results_are_ordered_as_input_texts(self, oneai_api: OneaiApi, mocker: MockerFixture):
+        texts = [f"text {index}" for index in range(20)]
+
+        def sentiment_analysis(language, text):
+            # first texts finish last, so completion order differs from input order
+            time.sleep(0.001 * (len(texts) - texts.index(text)))
+            return f"{language} {text}"
+
+        mocker.patch.object(oneai_api, 'text__sentiment_analysis', side_effect=sentiment_analysis)
+
+        output = oneai_api._text__sentiment_analysis__batch('en', texts)
+
+        expected_output = [f"en {text}" for text in texts]
+        assert output == expected_output, \
+            f"Expected `{expected_output}` but got `{output}`"
+
+    def test_exception_is_propagated(self, oneai_api: OneaiApi, mocker: MockerFixture):
+        def keyword_extraction(language, text):
+            if text == 'bad':
+                raise ProviderException('bad text', code=400)
+            return text
+
+        mocker.patch.object(oneai_api, 'text__keyword_extraction', side_effect=keyword_extraction)
+
+        with pytest.raises(ProviderException):
+            oneai_api._text__keyword_extraction__batch('en', ['good', 'bad', 'good'])
+
+
+class TestSentimentAnalysis:
+    @staticmethod
+    def sentiments_response(values):
+        labels = [
+            {'span_text': f"segment {index}", 'value': value}
+            for index, value in enumerate(values)
+        ]
+        return MagicMock(
+            status_code=200,
+            content=orjson.dumps({'output': [{'labels': labels}]})
+        )
+
+    @pytest.mark.parametrize(
+        ('values', 'expected_output'),
+        [
+            (['POS', 'POS', 'NEG'], 'Positive'),
+            (['NEG', 'NEG'], 'Negative'),
+            (['POS', 'NEG'], 'Neutral'),
+        ]
+    )
+    def test_general_sentiment(
+        self, oneai_api: OneaiApi, mocker: MockerFixture, values, expected_output
+    ):
+        mocker.patch.object(
+            oneai_api._session, 'post', return_value=self.sentiments_response(values)
+        )
+
+        output = oneai_api.text__sentiment_analysis('en', 'text').standardized_response
+
+        assert output.general_sentiment == expected_output, \
+            f"Expected `{expected_output}` for labels {values} but got `{output.general_sentiment}`"
+        assert [item.sentiment for item in output.items] == [
+            'Positive' if value == 'POS' else 'Negative' for value in values
+        ]
@@ -5,10 +5,13 @@
 """
 import pytest
 from pytest_mock import MockerFixture, mocker
+from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.languages import (
     AUTO_DETECT,
     AUTO_DETECT_NAME,
+    CLOSEST_MATCH_MAX_ATTEMPTS,
     check_language_format,
+    clear_language_caches,
     compare_language_and_region_code,
     convert_three_two_letters,
     expand_languages_for_user,
@@ -20,6 +23,12 @@ from edenai_apis.utils.languages import (
     provide_appropriate_language
 )
 
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    clear_language_caches()
+    yield
+
 class TestCheckLanguageFormat:
     def test_valid_language_code(self):
         assert check_language_format("en") == True, \
@@ -94,7 +103,7 @@ class TestLoadLanguageConstraints:
         }
         mocker.patch('edenai_apis.utils.languages.load_provider', return_value=ret_mock_value)
         output = load_language_constraints(self.PROVIDER, self.FEATUTRE, self.SUBFEATURE)
-        expected_output = ['en', 'fr']
+        expected_output = ('en', 'fr')
         assert output == expected_output, \
             f"Expected `{expected_output}` but got `{output}`"
 
@@ -111,7 +120,7 @@ class TestLoadLanguageConstraints:
         }
         mocker.patch('edenai_apis.utils.languages.load_provider', return_value=ret_mock_value)
         output = load_language_constraints(self.PROVIDER, self.FEATUTRE, self.SUBFEATURE)
-        expected_output = ['en', 'fr', 'auto-detect']
+        expected_output = ('en', 'fr', 'auto-detect')
         assert output == expected_output, \
             f"Expected `{expected_output}` but got `{output}`"
 
@@ -128,7 +137,7 @@ class TestLoadLanguageConstraints:
         }
         mocker.patch('edenai_apis.utils.languages.load_provider', return_value=ret_mock_value)
         output = load_language_constraints(self.PROVIDER, self.FEATUTRE, self.SUBFEATURE)
-        expected_output = ['en', 'fr']
+        expected_output = ('en', 'fr')
         assert output == expected_output, \
             f"Expected `{expected_output}` but got `{output}`"
 
@@ -144,7 +153,7 @@ class TestLoadLanguageConstraints:
         }
         mocker.patch('edenai_apis.utils.languages.load_provider', return_value=ret_mock_value)
         output = load_language_constraints(self.PROVIDER, self.FEATUTRE, self.SUBFEATURE)
-        expected_output = []
+        expected_output = ()
         assert output == expected_output, \
             f"Expected `{expected_output}` but got `{output}`"
 
@@ -160,12 +169,44 @@ class TestLoadLanguageConstraints:
         }
         mocker.patch('edenai_apis.utils.languages.load_provider', return_value=ret_mock_value)
         output = load_language_constraints(self.PROVIDER, self.FEATUTRE, self.SUBFEATURE)
-        expected_output = []
+        expected_output = ()
         assert output == expected_output, \
             f"Expected `{expected_output}` but got `{output}`"
 
 
 
+    def test_allow_null_language_does_not_mutate_provider_info(self, mocker: MockerFixture):
+        languages = ['en', 'fr']
+        ret_mock_value = {
+            "constraints": {
+                "languages": languages,
+                "allow_null_language": True,
+            }
+        }
+        mocker.patch('edenai_apis.utils.languages.load_provider', return_value=ret_mock_value)
+        load_language_constraints(self.PROVIDER, self.FEATUTRE, self.SUBFEATURE)
+        assert languages == ['en', 'fr'], \
+            f"Provider info languages must stay unchanged but got `{languages}`"
+
+    def test_second_call_is_cached(self, mocker: MockerFixture):
+        ret_mock_value = {
+            "constraints": {
+                "languages": [
+                    'en',
+                    'fr'
+                ]
+            }
+        }
+        load_provider_mock = mocker.patch(
+            'edenai_apis.utils.languages.load_provider', return_value=ret_mock_value
+        )
+        first_output = load_language_constraints(self.PROVIDER, self.FEATUTRE, self.SUBFEATURE)
+        second_output = load_language_constraints(self.PROVIDER, self.FEATUTRE, self.SUBFEATURE)
+        assert first_output == second_output
+        assert load_provider_mock.call_count == 1, \
+            "A second call with the same key must not reload the provider info"
+
+
 class TestExpandLanguagesForUser:
     def test_valid_list_languages(self):
         result = expand_languages_for_user(['auto-detect', 'en', 'fra', 'it-IT'])
@@ -432,4 +473,21 @@ class TestProvideAppropriateLanguage:
     def test_invalid_input(self):
         with pytest.raises(SyntaxError):
             iso_code = '12345'
-            provide_appropriate_language(iso_code, self.PROVIDER, self.FEATURE, self.SUBFEATURE)
\ No newline at end of file
+            provide_appropriate_language(iso_code, self.PROVIDER, self.FEATURE, self.SUBFEATURE)
+
+    def test_closest_supported_match_always_failing(self, mocker: MockerFixture):
+        mocker.patch(
+            'edenai_apis.utils.languages.load_language_constraints',
+            return_value=['en-US', 'fr', 'es']
+        )
+        closest_mock = mocker.patch(
+            'edenai_apis.utils.languages.closest_supported_match',
+            side_effect=RuntimeError
+        )
+        sleep_mock = mocker.patch('edenai_apis.utils.languages.time.sleep')
+
+        with pytest.raises(ProviderException):
+            provide_appropriate_language('en', self.PROVIDER, self.FEATURE, self.SUBFEATURE)
+        assert closest_mock.call_count == CLOSEST_MATCH_MAX_ATTEMPTS
+        assert sleep_mock.call_count == CLOSEST_MATCH_MAX_ATTEMPTS - 1, \
+            "No sleep is expected after the last attempt"
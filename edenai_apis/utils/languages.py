@@ -1,17 +1,26 @@
 import re
-from collections import defaultdict
+import time
+from functools import lru_cache
 from importlib import import_module
-from typing import List, Optional, Sequence
+from typing import Iterable, List, Optional, Tuple
 
 import pycountry
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.exception import ProviderException
 from langcodes import Language, closest_supported_match
 
 
 
 AUTO_DETECT = "auto-detect"
 AUTO_DETECT_NAME = "Auto detection"
+CLOSEST_MATCH_MAX_ATTEMPTS = 5
+
+_ISO_FORMAT_RE = re.compile(
+    r"^[a-z]{2,3}(-[a-z]{2,3})?(-[A-Z][a-z]{3})?(-([A-Z]{2,3}|\d{3}))?"
+)
+_UNKNOWN_LANG_RE = re.compile(r"\([a-zA-Z\s]*\)")
+_UNKNOWN_REGION_RE = re.compile(r"[a-zA-Z\s]*\(")
 
 class LanguageErrorMessage:
     LANGUAGE_REQUIRED = lambda input_lang: (
@@ -36,14 +45,13 @@ def check_language_format(iso_code: str) -> bool:
     """Checks if language code name is formatted correctly (lang-extlang-Script-Reg)"""
     if iso_code is None:
         return None
-    return bool(
-        re.fullmatch(
-            r"^[a-z]{2,3}(-[a-z]{2,3})?(-[A-Z][a-z]{3})?(-([A-Z]{2,3}|\d{3}))?",
-            iso_code,
-        )
-    )
+    # fast path for the common bare language codes (`en`, `fra`)
+    if len(iso_code) in (2, 3) and iso_code.isascii() and iso_code.isalpha() and iso_code.islower():
+        return True
+    return bool(_ISO_FORMAT_RE.fullmatch(iso_code))
 
 
+@lru_cache(maxsize=4096)
 def convert_three_two_letters(iso_code: str) -> Optional[str]:
     """Converts an iso639-3 language code to an iso639-2 language code if possible"""
     if iso_code is None:
@@ -58,7 +66,8 @@ def convert_three_two_letters(iso_code: str) -> Optional[str]:
     return language.alpha_2 if hasattr(language, "alpha_2") else language.alpha_3
 
 
-def load_language_constraints(provider_name: str, feature: str, subfeature: str) -> list:
+@lru_cache(maxsize=2048)
+def load_language_constraints(provider_name: str, feature: str, subfeature: str) -> Tuple[str, ...]:
     """Loads the list of languages supported by
     the provider for a couple of (feature, subfeature)"""
     info = load_provider(
@@ -67,14 +76,14 @@ def load_language_constraints(provider_name: str, feature: str, subfeature: str)
         feature=feature,
         subfeature=subfeature
     )
-    default = defaultdict(lambda: None)
-    languages = info.get("constraints", default).get("languages", [])
-    if info.get("constraints", default).get("allow_null_language"):
+    constraints = info.get("constraints") or {}
+    languages = list(constraints.get("languages", []))
+    if constraints.get("allow_null_language"):
         languages.append(AUTO_DETECT)
-    return languages
+    return tuple(languages)
 
 
-def expand_languages_for_user(list_languages: list) -> list:
+def expand_languages_for_user(list_languages: Iterable[str]) -> list:
     """Returns a list that extends the input list of languages (list_language)
     with formatted language tags and iso639-3 language codes"""
     appended_list = []
@@ -92,39 +101,57 @@ def expand_languages_for_user(list_languages: list) -> list:
     return appended_list
 
 
-def load_standardized_language(feature: str, subfeature: str, providers: Optional[List[str]]):
-    """Displays a standardized list of languages for a list of providers
-    for the pair (feature, subfeature)"""
-
+@lru_cache(maxsize=2048)
+def _load_standardized_language(
+    feature: str, subfeature: str, providers: Optional[Tuple[str, ...]]
+) -> List[str]:
     if providers is None:
         interface = import_module('edenai_apis.interface')
         providers = interface.list_providers(feature, subfeature)
 
-    result = []
+    result = set()
     for provider in providers:
-        list_languages = expand_languages_for_user(
-            load_language_constraints(provider, feature, subfeature)
+        result.update(
+            expand_languages_for_user(
+                load_language_constraints(provider, feature, subfeature)
+            )
+        )
+    return list(result)
+
+
+def load_standardized_language(feature: str, subfeature: str, providers: Optional[List[str]]):
+    """Displays a standardized list of languages for a list of providers
+    for the pair (feature, subfeature)"""
+    return list(
+        _load_standardized_language(
+            feature, subfeature, tuple(providers) if providers is not None else None
         )
-        result = list(set(list_languages + result))
-    return result
+    )
+
+
+def clear_language_caches() -> None:
+    """Clears the cached language constraints, to be called when providers info is reloaded"""
+    load_language_constraints.cache_clear()
+    _load_standardized_language.cache_clear()
 
 
 def format_language_name(language_name: str, isocode: str) -> str:
     """Formats language name by removing 'language'
     if this latter in Unknown or also removing 'region' if it's Unknown"""
     if "Unknown language" in language_name:
-        formatted = re.search(r"\([a-zA-Z\s]*\)", language_name)
+        formatted = _UNKNOWN_LANG_RE.search(language_name)
         return (
             f"Region: {formatted.group().split(')')[0].split('(')[1].strip()}"
             if formatted is not None
             else isocode
         )
     if "Unknown Region" in language_name:
-        formatted = re.search(r"[a-zA-Z\s]*\(", language_name)
+        formatted = _UNKNOWN_REGION_RE.search(language_name)
         return formatted.group().split("(")[0].strip()
     return language_name
 
 
+@lru_cache(maxsize=4096)
 def get_language_name_from_code(isocode: str) -> str:
     """Returns the language name from the isocode"""
     if isocode is None:
@@ -145,6 +172,7 @@ def get_language_name_from_code(isocode: str) -> str:
         output = language.display_name()
     return format_language_name(output, isocode)
 
+@lru_cache(maxsize=4096)
 def get_code_from_language_name(name: str) -> str:
     """Returns the iso639-2 from the language name"""
     try:
@@ -172,16 +200,21 @@ def provide_appropriate_language(iso_code: str, provider_name: str, feature: str
     if not check_language_format(iso_code):
         raise SyntaxError(f"Language code '{iso_code}' badly formatted")
 
-    list_languages: Sequence[str] = load_language_constraints(provider_name, feature, subfeature)
+    list_languages: Tuple[str, ...] = load_language_constraints(provider_name, feature, subfeature)
 
     # Sometimes closest_supported_match raise a RuntimeError,
-    # so we need a while True for catch this error and retry until function works
-    while True:
+    # so we retry a few times with a short backoff before giving up
+    for attempt in range(CLOSEST_MATCH_MAX_ATTEMPTS):
         try:
             selected_code_language = closest_supported_match(iso_code, list_languages)
             break
         except RuntimeError:
-            pass
+            if attempt < CLOSEST_MATCH_MAX_ATTEMPTS - 1:
+                time.sleep(0.001 * (1 << attempt))
+    else:
+        raise ProviderException(
+            f"Could not match language '{iso_code}' with provider supported languages"
+        )
 
     if '-' in iso_code and selected_code_language:
         if has_language_contrains_script(iso_code, selected_code_language):